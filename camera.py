@@ -1,5 +1,5 @@
 import numpy as np
-from math import cos, sin, pi
+from math import cos, sin, pi, sqrt
 from config import Config
 
 class Camera:
@@ -15,6 +15,11 @@ class Camera:
             config (Config): Configuration object containing camera settings.
         """
         self.config = config
+        # Copied out of config for the per-frame paths
+        self.mouse_sensitivity = config.mouse_sensitivity
+        self.zoom_speed = config.zoom_speed
+        self.min_distance = config.planet_radius + 0.1
+        self.max_distance = config.max_distance
         self.distance = config.initial_distance
         self.yaw = 0
         self.pitch = 0
@@ -30,6 +35,13 @@ class Camera:
         self.start_target = self.target.copy()
         self.end_position = self.position.copy()
         self.end_target = self.target.copy()
+        self._forward = np.empty(3)
+        self._right = np.empty(3)
+        self._move = np.empty(3)
+        self._trig_key = (None, None)
+        self._trig = (0.0, 1.0, 0.0, 1.0)
+        # Set whenever position, target or up change; cleared by the renderer
+        self.view_dirty = True
 
     def update(self, dx: float, dy: float, dt: float):
         """
@@ -55,9 +67,9 @@ class Camera:
             dx (float): Mouse movement in x-direction.
             dy (float): Mouse movement in y-direction.
         """
-        self.yaw += dx * self.config.mouse_sensitivity
-        self.pitch -= dy * self.config.mouse_sensitivity
-        self.pitch = np.clip(self.pitch, -pi/2 + 0.1, pi/2 - 0.1)
+        self.yaw += dx * self.mouse_sensitivity
+        self.pitch -= dy * self.mouse_sensitivity
+        self.pitch = max(-pi/2 + 0.1, min(pi/2 - 0.1, self.pitch))
         self._update_position()
 
     def _update_free(self, dx: float, dy: float):
@@ -68,25 +80,43 @@ class Camera:
             dx (float): Mouse movement in x-direction.
             dy (float): Mouse movement in y-direction.
         """
-        self.yaw -= dx * self.config.mouse_sensitivity
-        self.pitch -= dy * self.config.mouse_sensitivity
-        self.pitch = np.clip(self.pitch, -pi/2 + 0.1, pi/2 - 0.1)
+        self.yaw -= dx * self.mouse_sensitivity
+        self.pitch -= dy * self.mouse_sensitivity
+        self.pitch = max(-pi/2 + 0.1, min(pi/2 - 0.1, self.pitch))
         
-        forward = self._get_forward_vector()
-        self.target = self.position + forward
+        f, p = self._get_forward_vector(), self.position
+        x, y, z = p[0] + f[0], p[1] + f[1], p[2] + f[2]
+        target = self.target
+        if target[0] != x or target[1] != y or target[2] != z:
+            target[0], target[1], target[2] = x, y, z
+            self.view_dirty = True
 
     def _get_forward_vector(self):
         """
         Calculate and return the forward vector based on yaw and pitch.
 
         Returns:
-            np.array: The forward vector.
+            np.array: The forward vector. The buffer is reused between calls.
         """
-        return np.array([
-            cos(self.pitch) * sin(self.yaw),
-            sin(self.pitch),
-            cos(self.pitch) * cos(self.yaw)
-        ])
+        sp, cp, sy, cy = self._trig_values()
+        self._forward[0] = cp * sy
+        self._forward[1] = sp
+        self._forward[2] = cp * cy
+        return self._forward
+
+    def _trig_values(self):
+        """
+        Return the sines and cosines of pitch and yaw, recomputing them only
+        when the orientation has changed.
+
+        Returns:
+            tuple: (sin(pitch), cos(pitch), sin(yaw), cos(yaw)).
+        """
+        key = (self.yaw, self.pitch)
+        if key != self._trig_key:
+            self._trig = (sin(self.pitch), cos(self.pitch), sin(self.yaw), cos(self.yaw))
+            self._trig_key = key
+        return self._trig
 
     def move(self, forward: float, right: float, up: float, boost: bool):
         """
@@ -98,18 +128,25 @@ class Camera:
             up (float): Amount of upward movement.
             boost (bool): Whether to apply speed boost.
         """
-        if self.mode != 'free':
+        if self.mode != 'free' or not (forward or right or up):
             return
 
         speed = self.speed * (self.boost_factor if boost else 1)
         
-        forward_vec = self._get_forward_vector()
-        right_vec = np.cross(forward_vec, self.up)
-        right_vec /= np.linalg.norm(right_vec)
-
-        movement = forward_vec * forward + right_vec * right + self.up * up
-        self.position += movement * speed
-        self.target += movement * speed
+        # Everything below works in preallocated buffers; np.cross has no out=
+        f, u = self._get_forward_vector(), self.up
+        right_vec = self._right
+        right_vec[0] = f[1] * u[2] - f[2] * u[1]
+        right_vec[1] = f[2] * u[0] - f[0] * u[2]
+        right_vec[2] = f[0] * u[1] - f[1] * u[0]
+        right_vec *= right * speed / sqrt(right_vec @ right_vec)
+
+        movement = np.multiply(f, forward * speed, out=self._move)
+        movement += right_vec
+        movement += np.multiply(u, up * speed, out=right_vec)
+        self.position += movement
+        self.target += movement
+        self.view_dirty = True
 
     def zoom(self, amount: float):
         """
@@ -119,21 +156,23 @@ class Camera:
             amount (float): Amount of zoom. Positive values zoom in, negative values zoom out.
         """
         if self.mode == 'orbit':
-            self.distance -= amount * self.config.zoom_speed
-            self.distance = np.clip(self.distance, self.config.planet_radius + 0.1, self.config.max_distance)
+            self.distance -= amount * self.zoom_speed
+            self.distance = max(self.min_distance, min(self.max_distance, self.distance))
             self._update_position()
         elif self.mode == 'free':
-            self.move(amount * self.config.zoom_speed, 0, 0, False)
+            self.move(amount * self.zoom_speed, 0, 0, False)
 
     def _update_position(self):
         """
         Update the camera position based on distance, yaw, and pitch in orbit mode.
         """
-        self.position = np.array([
-            self.distance * cos(self.pitch) * sin(self.yaw),
-            self.distance * sin(self.pitch),
-            self.distance * cos(self.pitch) * cos(self.yaw)
-        ])
+        sp, cp, sy, cy = self._trig_values()
+        horizontal = self.distance * cp
+        x, y, z = horizontal * sy, self.distance * sp, horizontal * cy
+        position = self.position
+        if position[0] != x or position[1] != y or position[2] != z:
+            position[0], position[1], position[2] = x, y, z
+            self.view_dirty = True
 
     def toggle_mode(self):
         """
@@ -170,6 +209,7 @@ class Camera:
             t = self._ease_in_out_cubic(self.transition_progress)
             self.position = self.start_position * (1 - t) + self.end_position * t
             self.target = self.start_target * (1 - t) + self.end_target * t
+            self.view_dirty = True
 
     @staticmethod
     def _ease_in_out_cubic(t: float) -> float:
@@ -182,7 +222,10 @@ class Camera:
         Returns:
             float: Eased value between 0 and 1.
         """
-        return 4 * t * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 3) / 2
+        if t < 0.5:
+            return 4 * t * t * t
+        u = -2 * t + 2
+        return 1 - u * u * u * 0.5
 
     def check_collision(self, planet_radius: float):
         """
@@ -191,9 +234,12 @@ class Camera:
         Args:
             planet_radius (float): Radius of the planet.
         """
-        distance_to_center = np.linalg.norm(self.position)
-        if distance_to_center < planet_radius + 0.1:
-            direction = self.position / distance_to_center
-            self.position = direction * (planet_radius + 0.1)
+        min_distance = planet_radius + 0.1
+        x, y, z = self.position
+        distance_squared = x * x + y * y + z * z
+        if distance_squared < min_distance * min_distance:
+            direction = self.position / sqrt(distance_squared)
+            self.position = direction * min_distance
+            self.view_dirty = True
             if self.mode == 'orbit':
-                self.distance = planet_radius + 0.1
\ No newline at end of file
+                self.distance = min_distance
\ No newline at end of file
@@ -1,11 +1,20 @@
-from pydantic import BaseModel, Field, field_validator
+from dataclasses import dataclass, field, fields
+from typing import Optional
 
-class Config(BaseModel):
+def Field(default, ge=None, le=None, gt=None, description=""):
+    """
+    Declare a config setting with optional bounds, checked in Config.__post_init__.
+    """
+    return field(default=default, metadata={'ge': ge, 'le': le, 'gt': gt, 'description': description})
+
+@dataclass(frozen=True)
+class Config:
     # Window settings
     width: int = Field(2560, ge=800, le=7680, description="Window width in pixels")
     height: int = Field(1440, ge=600, le=4320, description="Window height in pixels")
     fullscreen: bool = Field(True, description="Whether to run in fullscreen mode")
     fps: int = Field(165, ge=30, le=240, description="Target frames per second")
+    idle_fps: int = Field(15, ge=1, le=240, description="Frames per second while the view is static")
 
     # Camera settings
     fov: float = Field(60.0, ge=30.0, le=120.0, description="Field of view in degrees")
@@ -22,22 +31,22 @@ class Config(BaseModel):
     planet_radius: float = Field(10.0, ge=1.0, le=50.0, description="Radius of the planet")
     texture_width: int = Field(512, ge=512, le=8192, description="Width of the planet texture")
     texture_height: int = Field(256, ge=256, le=4096, description="Height of the planet texture")
+    texture_seed: Optional[int] = Field(0, ge=0, description="Seed for the planet texture (None for a new planet every launch, uncached)")
     sphere_detail: int = Field(100, ge=20, le=1000, description="Level of detail for the planet sphere")
+    gpu_texture: bool = Field(False, description="Generate the planet texture with a fragment shader instead of on the CPU")
 
     # Simulation settings
     day_length: float = Field(3600.0, ge=10.0, le=3600.0, description="Length of a day in seconds")
 
-    @field_validator('max_distance')
-    def max_distance_must_be_greater_than_initial(cls, v, values):
-        if 'initial_distance' in values and v <= values['initial_distance']:
+    def __post_init__(self):
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is None:
+                continue
+            ge, le, gt = f.metadata['ge'], f.metadata['le'], f.metadata['gt']
+            if (ge is not None and value < ge) or (le is not None and value > le) or (gt is not None and value <= gt):
+                raise ValueError(f"{f.name}={value!r} is out of range")
+        if self.max_distance <= self.initial_distance:
             raise ValueError('max_distance must be greater than initial_distance')
-        return v
-
-    @field_validator('far')
-    def far_must_be_greater_than_near(cls, v, values):
-        if 'near' in values and v <= values['near']:
+        if self.far <= self.near:
             raise ValueError('far must be greater than near')
-        return v
-
-    class Config:
-        arbitrary_types_allowed = True
\ No newline at end of file
@@ -1,7 +1,12 @@
+import ctypes
+import threading
+from concurrent.futures import Future
 from OpenGL.GL import *
-from OpenGL.GLU import *
+from OpenGL.GL.EXT.texture_filter_anisotropic import *
 from config import Config
 from texture_generator import TextureGenerator
+from shaders import (compile_program, TEXTURE_VERTEX_SHADER, TEXTURE_FRAGMENT_SHADER,
+                     PLANET_VERTEX_SHADER, PLANET_FRAGMENT_SHADER)
 import numpy as np
 
 class Planet:
@@ -18,13 +23,25 @@ class Planet:
         """
         self.config = config
         self.radius = config.planet_radius
+        self._texture_future = None
         self.texture = self._load_texture()
-        self.sphere = self._create_sphere()
+        self.vertex_buffer, self.index_buffer, self.index_count = self._create_sphere()
+        self.program = compile_program(PLANET_VERTEX_SHADER, PLANET_FRAGMENT_SHADER)
+        self.attributes = {name: glGetAttribLocation(self.program, name)
+                           for name in ("a_position", "a_normal", "a_texcoord")}
+        self.sun_angle_location = glGetUniformLocation(self.program, "u_sun_angle")
+        self._day_angle_scale = 2 * np.pi / config.day_length
+        glUseProgram(self.program)
+        glUniform1i(glGetUniformLocation(self.program, "u_texture"), 0)
+        glUseProgram(0)
 
     def _load_texture(self):
         """
         Load and create the planet's texture.
 
+        CPU textures are generated on a worker thread; a flat placeholder is
+        shown until update() uploads the result.
+
         Returns:
             int: OpenGL texture ID.
 
@@ -32,36 +49,178 @@ class Planet:
             RuntimeError: If texture generation or loading fails.
         """
         try:
-            img = TextureGenerator.generate(self.config.texture_width, self.config.texture_height)
             texture_id = glGenTextures(1)
             glBindTexture(GL_TEXTURE_2D, texture_id)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, img.width, img.height, 0, GL_RGB, GL_UNSIGNED_BYTE, img.tobytes())
+            if glInitTextureFilterAnisotropicEXT():
+                max_anisotropy = glGetFloatv(GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT)
+                glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAX_ANISOTROPY_EXT, min(16.0, max_anisotropy))
+            if self.config.gpu_texture:
+                self._render_texture(texture_id)
+                glGenerateMipmap(GL_TEXTURE_2D)
+            else:
+                # A daemon thread, unlike an executor worker, is not joined at exit,
+                # so quitting mid-generation does not wait for it
+                self._texture_future = Future()
+                threading.Thread(target=self._generate_texture, args=(self._texture_future,), daemon=True).start()
+                self._upload_texture(texture_id, np.full((4, 4, 3), 128, dtype=np.uint8))
             return texture_id
         except Exception as e:
             raise RuntimeError(f"Failed to load planet texture: {str(e)}")
 
+    def _generate_texture(self, future: Future):
+        """
+        Generate the planet's texture on a worker thread.
+
+        Args:
+            future (Future): Receives the generated texture or the error raised.
+        """
+        try:
+            future.set_result(TextureGenerator.generate(self.config.texture_width, self.config.texture_height,
+                                                        self.config.texture_seed))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _upload_texture(self, texture_id: int, pixels: np.ndarray):
+        """
+        Upload texture data and rebuild its mipmaps.
+
+        Args:
+            texture_id (int): OpenGL texture ID to upload into.
+            pixels (np.ndarray): RGB data as a C-contiguous (height, width, 3) uint8 array.
+        """
+        glBindTexture(GL_TEXTURE_2D, texture_id)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, pixels.shape[1], pixels.shape[0], 0,
+                     GL_RGB, GL_UNSIGNED_BYTE, pixels)
+        glGenerateMipmap(GL_TEXTURE_2D)
+
+    def update(self) -> bool:
+        """
+        Swap in the generated texture once the worker thread has finished.
+        Must be called from the thread that owns the OpenGL context.
+
+        Returns:
+            bool: True if the texture changed.
+
+        Raises:
+            RuntimeError: If texture generation failed.
+        """
+        if self._texture_future is None or not self._texture_future.done():
+            return False
+        future, self._texture_future = self._texture_future, None
+        try:
+            self._upload_texture(self.texture, future.result())
+        except Exception as e:
+            raise RuntimeError(f"Failed to load planet texture: {str(e)}")
+        return True
+
+    def _render_texture(self, texture_id: int):
+        """
+        Generate the planet's texture on the GPU by drawing a fullscreen
+        triangle into it with the noise fragment shader.
+
+        Args:
+            texture_id (int): OpenGL texture ID to render into.
+
+        Raises:
+            RuntimeError: If the framebuffer cannot be set up.
+        """
+        width, height = self.config.texture_width, self.config.texture_height
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, width, height, 0, GL_RGB, GL_UNSIGNED_BYTE, None)
+
+        program = compile_program(TEXTURE_VERTEX_SHADER, TEXTURE_FRAGMENT_SHADER)
+        framebuffer = glGenFramebuffers(1)
+        glBindFramebuffer(GL_FRAMEBUFFER, framebuffer)
+        glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, texture_id, 0)
+        if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
+            raise RuntimeError("Texture framebuffer is incomplete.")
+
+        rng = np.random.default_rng(self.config.texture_seed)
+        base = TextureGenerator.BASE_NOISE
+        detail = TextureGenerator.DETAIL_NOISE
+        viewport = glGetIntegerv(GL_VIEWPORT)
+        glViewport(0, 0, width, height)
+        glUseProgram(program)
+        glUniform2f(glGetUniformLocation(program, "u_size"), width, height)
+        glUniform3f(glGetUniformLocation(program, "u_base"), base['scale'], base['octaves'], base['persistence'])
+        glUniform3f(glGetUniformLocation(program, "u_detail"), detail['scale'], detail['octaves'], detail['persistence'])
+        glUniform1f(glGetUniformLocation(program, "u_lacunarity"), 2.0)
+        glUniform3f(glGetUniformLocation(program, "u_color1"), *rng.integers(100, 200, 3))
+        glUniform3f(glGetUniformLocation(program, "u_color2"), *rng.integers(100, 200, 3))
+
+        glBegin(GL_TRIANGLES)
+        glVertex2f(-1, -1)
+        glVertex2f(3, -1)
+        glVertex2f(-1, 3)
+        glEnd()
+
+        glUseProgram(0)
+        glViewport(*viewport)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        glDeleteFramebuffers(1, [framebuffer])
+        glDeleteProgram(program)
+
     def _create_sphere(self):
         """
-        Create a GLU quadric object for rendering the planet sphere.
+        Build the planet's sphere mesh and upload it to the GPU.
+
+        The mesh matches the vertices and texture coordinates of gluSphere
+        rotated to put the poles on the y axis.
 
         Returns:
-            GLUquadric: GLU quadric object for the planet sphere.
+            tuple: Vertex buffer ID, index buffer ID and number of indices.
         """
-        sphere = gluNewQuadric()
-        gluQuadricNormals(sphere, GLU_SMOOTH)
-        gluQuadricTexture(sphere, GL_TRUE)
-        return sphere
+        detail = self.config.sphere_detail
+        rho, theta = np.meshgrid(np.linspace(0, np.pi, detail + 1),
+                                 np.linspace(0, 2 * np.pi, detail + 1), indexing='ij')
+        sin_rho = np.sin(rho)
+        normals = np.stack([np.sin(theta) * sin_rho, np.cos(rho), -np.cos(theta) * sin_rho], axis=-1)
+        texcoords = np.stack([1 - theta / (2 * np.pi), 1 - rho / np.pi], axis=-1)
+        vertices = np.concatenate([normals * self.radius, normals, texcoords], axis=-1)
+        vertices = np.ascontiguousarray(vertices.reshape(-1, 8), dtype=np.float32)
+
+        # Two triangles per quad between neighbouring stacks and slices
+        first = (np.arange(detail)[:, None] * (detail + 1) + np.arange(detail)[None, :]).ravel()
+        below = first + detail + 1
+        indices = np.stack([first, below, first + 1, first + 1, below, below + 1], axis=-1)
+        indices = np.ascontiguousarray(indices.ravel(), dtype=np.uint32)
+
+        vertex_buffer, index_buffer = glGenBuffers(2)
+        glBindBuffer(GL_ARRAY_BUFFER, vertex_buffer)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, index_buffer)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        return vertex_buffer, index_buffer, indices.size
 
-    def draw(self):
+    def draw(self, time: float):
         """
         Draw the planet using OpenGL.
+
+        Args:
+            time (float): The current simulation time, which drives the day/night cycle.
         """
-        glEnable(GL_TEXTURE_2D)
+        glUseProgram(self.program)
+        # Reduce in double precision; a float32 time loses resolution over long sessions
+        glUniform1f(self.sun_angle_location, (time % self.config.day_length) * self._day_angle_scale)
+        glActiveTexture(GL_TEXTURE0)
         glBindTexture(GL_TEXTURE_2D, self.texture)
-        glPushMatrix()
-        glRotatef(-90, 1, 0, 0)  # Rotate to show poles correctly
-        gluSphere(self.sphere, self.radius, self.config.sphere_detail, self.config.sphere_detail)
-        glPopMatrix()
-        glDisable(GL_TEXTURE_2D)
\ No newline at end of file
+        glBindBuffer(GL_ARRAY_BUFFER, self.vertex_buffer)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.index_buffer)
+
+        stride = 8 * 4
+        for name, size, offset in (("a_position", 3, 0), ("a_normal", 3, 12), ("a_texcoord", 2, 24)):
+            location = self.attributes[name]
+            glEnableVertexAttribArray(location)
+            glVertexAttribPointer(location, size, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(offset))
+
+        glDrawElements(GL_TRIANGLES, self.index_count, GL_UNSIGNED_INT, None)
+
+        for location in self.attributes.values():
+            glDisableVertexAttribArray(location)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
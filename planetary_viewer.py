@@ -37,11 +37,15 @@ class PlanetaryViewer:
     def run(self):
         clock = pygame.time.Clock()
         running = True
+        active = True
         while running:
-            dt = clock.tick(self.config.fps) / 1000.0
+            # Drop to the idle rate while nothing but the sun is moving
+            dt = clock.tick(self.config.fps if active else self.config.idle_fps) / 1000.0
             self.time += dt
             running = self.handle_events()
+            texture_changed = self.planet.update()  # Picks up the background-generated texture
             self.camera.update(0, 0, dt)  # Update camera with delta time
             self.camera.check_collision(self.config.planet_radius)
+            active = self.camera.view_dirty or texture_changed
             self.renderer.render(self.planet, self.camera, self.time)
         pygame.quit()
\ No newline at end of file
@@ -1,5 +1,4 @@
 import pygame
-import math
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from config import Config
@@ -38,10 +37,6 @@ class Renderer:
         """
         glViewport(0, 0, self.config.width, self.config.height)
         glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        glEnable(GL_COLOR_MATERIAL)
-        glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
 
         # Set up projection matrix
         glMatrixMode(GL_PROJECTION)
@@ -61,35 +56,14 @@ class Renderer:
         # Clear the screen and depth buffer
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         
-        # Set up the camera
-        glLoadIdentity()
-        gluLookAt(*camera.position, *camera.target, *camera.up)
-
-        # Update light position for day/night cycle
-        self._update_lighting(time)
+        # Set up the camera; the modelview matrix persists while the view is unchanged
+        if camera.view_dirty:
+            glLoadIdentity()
+            gluLookAt(*camera.position, *camera.target, *camera.up)
+            camera.view_dirty = False
 
-        # Draw the planet
-        planet.draw()
+        # Draw the planet, lit for the current time of day
+        planet.draw(time)
 
         # Swap the display buffers
         pygame.display.flip()
-
-    def _update_lighting(self, time: float):
-        """
-        Update the lighting based on the time of day.
-
-        Args:
-            time (float): The current simulation time.
-        """
-        # Calculate light position based on time
-        angle = (time % self.config.day_length) / self.config.day_length * 2 * math.pi
-        light_x = math.cos(angle)
-        light_y = 0.2  # Slight angle from horizontal
-        light_z = math.sin(angle)
-        glLightfv(GL_LIGHT0, GL_POSITION, (light_x, light_y, light_z, 0))
-
-        # Adjust ambient light based on time of day
-        day_factor = (math.sin(angle) + 1) / 2  # 0 to 1
-        ambient = 0.2 + 0.2 * day_factor
-        glLightfv(GL_LIGHT0, GL_AMBIENT, (ambient, ambient, ambient, 1))
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, (0.8, 0.8, 0.8, 1))
\ No newline at end of file
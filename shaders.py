@@ -0,0 +1,191 @@
+from OpenGL.GL import GL_VERTEX_SHADER, GL_FRAGMENT_SHADER
+from OpenGL.GL.shaders import compileProgram, compileShader
+
+# Ashima Arts / Ian McEwan 3D simplex noise (MIT licensed, github.com/ashima/webgl-noise)
+SIMPLEX_NOISE_GLSL = """
+vec3 mod289(vec3 x) { return x - floor(x * (1.0 / 289.0)) * 289.0; }
+vec4 mod289(vec4 x) { return x - floor(x * (1.0 / 289.0)) * 289.0; }
+vec4 permute(vec4 x) { return mod289(((x * 34.0) + 1.0) * x); }
+vec4 taylorInvSqrt(vec4 r) { return 1.79284291400159 - 0.85373472095314 * r; }
+
+float snoise(vec3 v)
+{
+    const vec2 C = vec2(1.0 / 6.0, 1.0 / 3.0);
+    const vec4 D = vec4(0.0, 0.5, 1.0, 2.0);
+
+    vec3 i = floor(v + dot(v, C.yyy));
+    vec3 x0 = v - i + dot(i, C.xxx);
+
+    vec3 g = step(x0.yzx, x0.xyz);
+    vec3 l = 1.0 - g;
+    vec3 i1 = min(g.xyz, l.zxy);
+    vec3 i2 = max(g.xyz, l.zxy);
+
+    vec3 x1 = x0 - i1 + C.xxx;
+    vec3 x2 = x0 - i2 + C.yyy;
+    vec3 x3 = x0 - D.yyy;
+
+    i = mod289(i);
+    vec4 p = permute(permute(permute(
+                i.z + vec4(0.0, i1.z, i2.z, 1.0))
+              + i.y + vec4(0.0, i1.y, i2.y, 1.0))
+              + i.x + vec4(0.0, i1.x, i2.x, 1.0));
+
+    float n_ = 0.142857142857;
+    vec3 ns = n_ * D.wyz - D.xzx;
+
+    vec4 j = p - 49.0 * floor(p * ns.z * ns.z);
+
+    vec4 x_ = floor(j * ns.z);
+    vec4 y_ = floor(j - 7.0 * x_);
+
+    vec4 x = x_ * ns.x + ns.yyyy;
+    vec4 y = y_ * ns.x + ns.yyyy;
+    vec4 h = 1.0 - abs(x) - abs(y);
+
+    vec4 b0 = vec4(x.xy, y.xy);
+    vec4 b1 = vec4(x.zw, y.zw);
+
+    vec4 s0 = floor(b0) * 2.0 + 1.0;
+    vec4 s1 = floor(b1) * 2.0 + 1.0;
+    vec4 sh = -step(h, vec4(0.0));
+
+    vec4 a0 = b0.xzyw + s0.xzyw * sh.xxyy;
+    vec4 a1 = b1.xzyw + s1.xzyw * sh.zzww;
+
+    vec3 p0 = vec3(a0.xy, h.x);
+    vec3 p1 = vec3(a0.zw, h.y);
+    vec3 p2 = vec3(a1.xy, h.z);
+    vec3 p3 = vec3(a1.zw, h.w);
+
+    vec4 norm = taylorInvSqrt(vec4(dot(p0, p0), dot(p1, p1), dot(p2, p2), dot(p3, p3)));
+    p0 *= norm.x;
+    p1 *= norm.y;
+    p2 *= norm.z;
+    p3 *= norm.w;
+
+    vec4 m = max(0.6 - vec4(dot(x0, x0), dot(x1, x1), dot(x2, x2), dot(x3, x3)), 0.0);
+    m = m * m;
+    return 42.0 * dot(m * m, vec4(dot(p0, x0), dot(p1, x1), dot(p2, x2), dot(p3, x3)));
+}
+"""
+
+TEXTURE_VERTEX_SHADER = """#version 120
+
+void main()
+{
+    gl_Position = gl_Vertex;
+}
+"""
+
+TEXTURE_FRAGMENT_SHADER = """#version 120
+
+const float PI = 3.14159265358979;
+const int MAX_OCTAVES = 16;
+// Typical peak of the blended fractal noise; stands in for the CPU min/max stretch
+const float NOISE_RANGE = 0.65;
+
+uniform vec2 u_size;
+uniform vec3 u_base;    // scale, octaves, persistence
+uniform vec3 u_detail;  // scale, octaves, persistence
+uniform float u_lacunarity;
+uniform vec3 u_color1;
+uniform vec3 u_color2;
+""" + SIMPLEX_NOISE_GLSL + """
+float fractal(vec3 p, vec3 params)
+{
+    float freq = 1.0;
+    float amp = 1.0;
+    float max_amp = 0.0;
+    float total = 0.0;
+    for (int i = 0; i < MAX_OCTAVES; i++) {
+        if (float(i) >= params.y) break;
+        total += snoise(p * params.x * freq) * amp;
+        max_amp += amp;
+        freq *= u_lacunarity;
+        amp *= params.z;
+    }
+    return total / max_amp;
+}
+
+void main()
+{
+    vec2 pixel = floor(gl_FragCoord.xy);
+    float theta = pixel.x / u_size.x * 2.0 * PI;
+    float phi = pixel.y / u_size.y * PI;
+    vec3 p = vec3(cos(theta) * sin(phi), sin(theta) * sin(phi), cos(phi));
+
+    float combined = fractal(p, u_base) * 0.7 + fractal(p, u_detail) * 0.3;
+    float value = clamp(combined / (2.0 * NOISE_RANGE) + 0.5, 0.0, 1.0);
+
+    vec3 color = mix(u_color1, u_color2, value);
+    float variation = 0.99 + 0.02 * fract(sin(dot(pixel, vec2(12.9898, 78.233))) * 43758.5453);
+    gl_FragColor = vec4(clamp(color * variation, 0.0, 255.0) / 255.0, 1.0);
+}
+"""
+
+PLANET_VERTEX_SHADER = """#version 120
+
+uniform float u_sun_angle;
+
+attribute vec3 a_position;
+attribute vec3 a_normal;
+attribute vec2 a_texcoord;
+
+varying vec3 v_normal;
+varying vec2 v_texcoord;
+varying vec3 v_light_dir;
+varying float v_ambient;
+
+void main()
+{
+    // Sun circles the planet once per day, slightly above the horizon
+    float s = sin(u_sun_angle);
+    vec3 light_dir = vec3(cos(u_sun_angle), 0.2, s);
+    float day = 0.5 * (s + 1.0);
+
+    v_light_dir = normalize((gl_ModelViewMatrix * vec4(light_dir, 0.0)).xyz);
+    v_ambient = 0.2 + 0.2 * day;
+    v_normal = gl_NormalMatrix * a_normal;
+    v_texcoord = a_texcoord;
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(a_position, 1.0);
+}
+"""
+
+PLANET_FRAGMENT_SHADER = """#version 120
+
+const float SCENE_AMBIENT = 0.2;
+const float DIFFUSE = 0.8;
+
+uniform sampler2D u_texture;
+
+varying vec3 v_normal;
+varying vec2 v_texcoord;
+varying vec3 v_light_dir;
+varying float v_ambient;
+
+void main()
+{
+    float lambert = max(dot(normalize(v_normal), normalize(v_light_dir)), 0.0);
+    float light = min(SCENE_AMBIENT + v_ambient + DIFFUSE * lambert, 1.0);
+    vec4 texel = texture2D(u_texture, v_texcoord);
+    gl_FragColor = vec4(texel.rgb * light, texel.a);
+}
+"""
+
+
+def compile_program(vertex_source: str, fragment_source: str) -> int:
+    """
+    Compile and link a GLSL program.
+
+    Args:
+        vertex_source (str): Source of the vertex shader.
+        fragment_source (str): Source of the fragment shader.
+
+    Returns:
+        int: OpenGL program ID.
+    """
+    return compileProgram(
+        compileShader(vertex_source, GL_VERTEX_SHADER),
+        compileShader(fragment_source, GL_FRAGMENT_SHADER),
+    )
@@ -0,0 +1,140 @@
+import numpy as np
+from math import floor
+from numba import config, njit, prange
+
+# Noise is generated on a worker thread; the TBB layer can hang interpreter
+# shutdown when its first parallel region starts off the main thread.
+config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
+
+# Ken Perlin's reference permutation, repeated so lookups never need wrapping
+PERM = np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+    140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148,
+    247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32,
+    57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175,
+    74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122,
+    60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54,
+    65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169,
+    200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64,
+    52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212,
+    207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213,
+    119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9,
+    129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104,
+    218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241,
+    81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157,
+    184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93,
+    222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+] * 2, dtype=np.int64)
+
+GRAD3 = np.array([
+    [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0],
+    [1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],
+    [0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1],
+], dtype=np.float64)
+
+F3 = 1.0 / 3.0
+G3 = 1.0 / 6.0
+
+
+@njit(cache=True)
+def _corner(gi: int, x: float, y: float, z: float) -> float:
+    """
+    Contribution of a single simplex corner.
+    """
+    t = 0.6 - x * x - y * y - z * z
+    if t <= 0.0:
+        return 0.0
+    t *= t
+    return t * t * (GRAD3[gi, 0] * x + GRAD3[gi, 1] * y + GRAD3[gi, 2] * z)
+
+
+@njit(cache=True)
+def _noise3(x: float, y: float, z: float) -> float:
+    """
+    Single-octave 3D simplex noise, matching noise.snoise3.
+    """
+    s = (x + y + z) * F3
+    i = floor(x + s)
+    j = floor(y + s)
+    k = floor(z + s)
+    t = (i + j + k) * G3
+    x0 = x - (i - t)
+    y0 = y - (j - t)
+    z0 = z - (k - t)
+
+    if x0 >= y0:
+        if y0 >= z0:
+            i1, j1, k1, i2, j2, k2 = 1, 0, 0, 1, 1, 0
+        elif x0 >= z0:
+            i1, j1, k1, i2, j2, k2 = 1, 0, 0, 1, 0, 1
+        else:
+            i1, j1, k1, i2, j2, k2 = 0, 0, 1, 1, 0, 1
+    else:
+        if y0 < z0:
+            i1, j1, k1, i2, j2, k2 = 0, 0, 1, 0, 1, 1
+        elif x0 < z0:
+            i1, j1, k1, i2, j2, k2 = 0, 1, 0, 0, 1, 1
+        else:
+            i1, j1, k1, i2, j2, k2 = 0, 1, 0, 1, 1, 0
+
+    ii = int(i) & 255
+    jj = int(j) & 255
+    kk = int(k) & 255
+    g0 = PERM[ii + PERM[jj + PERM[kk]]] % 12
+    g1 = PERM[ii + i1 + PERM[jj + j1 + PERM[kk + k1]]] % 12
+    g2 = PERM[ii + i2 + PERM[jj + j2 + PERM[kk + k2]]] % 12
+    g3 = PERM[ii + 1 + PERM[jj + 1 + PERM[kk + 1]]] % 12
+
+    n = _corner(g0, x0, y0, z0)
+    n += _corner(g1, x0 - i1 + G3, y0 - j1 + G3, z0 - k1 + G3)
+    n += _corner(g2, x0 - i2 + 2.0 * G3, y0 - j2 + 2.0 * G3, z0 - k2 + 2.0 * G3)
+    n += _corner(g3, x0 - 1.0 + 3.0 * G3, y0 - 1.0 + 3.0 * G3, z0 - 1.0 + 3.0 * G3)
+    return n * 32.0
+
+
+@njit(cache=True)
+def snoise3(x: float, y: float, z: float, octaves: int = 1,
+            persistence: float = 0.5, lacunarity: float = 2.0) -> float:
+    """
+    Fractal 3D simplex noise with the same parameters as noise.snoise3.
+    """
+    freq = 1.0
+    amp = 1.0
+    max_amp = 0.0
+    total = 0.0
+    for _ in range(octaves):
+        total += _noise3(x * freq, y * freq, z * freq) * amp
+        max_amp += amp
+        freq *= lacunarity
+        amp *= persistence
+    return total / max_amp
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def generate_noise(cos_theta: np.ndarray, sin_theta: np.ndarray, sin_phi: np.ndarray, cos_phi: np.ndarray,
+                   scale: float, octaves: int, persistence: float, lacunarity: float) -> np.ndarray:
+    """
+    Generate a seamless noise field, one row per thread.
+
+    Args:
+        cos_theta (np.ndarray): cos(theta) for every column.
+        sin_theta (np.ndarray): sin(theta) for every column.
+        sin_phi (np.ndarray): sin(phi) for every row.
+        cos_phi (np.ndarray): cos(phi) for every row.
+        scale (float): The scale of the noise.
+        octaves (int): The number of octaves for the noise.
+        persistence (float): The persistence for each octave.
+        lacunarity (float): The lacunarity for each octave.
+
+    Returns:
+        np.ndarray: The generated seamless noise.
+    """
+    height = sin_phi.shape[0]
+    width = cos_theta.shape[0]
+    world = np.zeros((height, width), dtype=np.float32)
+    for y in prange(height):
+        ring = sin_phi[y] * scale
+        z3 = cos_phi[y] * scale
+        for x in range(width):
+            world[y, x] = snoise3(cos_theta[x] * ring, sin_theta[x] * ring, z3, octaves, persistence, lacunarity)
+    return world
@@ -1,23 +1,48 @@
+import os
+import hashlib
+from typing import Optional
 import numpy as np
 from noise import snoise3
 from PIL import Image
 
+try:
+    import pyfastnoisesimd
+except ImportError:  # Optional SIMD backend; fall back to scalar snoise3
+    pyfastnoisesimd = None
+
+try:
+    import simplex_jit
+except ImportError:  # Optional Numba backend; fall back to scalar snoise3
+    simplex_jit = None
+
 class TextureGenerator:
     """
     Generates seamless textures for planetary surfaces.
     """
 
+    # Noise layers blended into the final texture (also used by the GPU shader)
+    BASE_NOISE = {'scale': 4.0, 'octaves': 6, 'persistence': 0.5}
+    DETAIL_NOISE = {'scale': 20.0, 'octaves': 8, 'persistence': 0.6}
+
+    # Bump whenever the pixels produced for a given seed change
+    CACHE_VERSION = 1
+    CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'planetary-viewer')
+
     @staticmethod
-    def generate(width: int, height: int) -> Image.Image:
+    def generate(width: int, height: int, seed: Optional[int] = None) -> np.ndarray:
         """
         Generate a seamless texture for a planetary surface.
 
+        Seeded textures are cached on disk, so a repeated call with the same
+        parameters only has to decode a PNG.
+
         Args:
             width (int): The width of the texture in pixels.
             height (int): The height of the texture in pixels.
+            seed (int, optional): Seed for the random colors and variation.
 
         Returns:
-            Image.Image: The generated texture as a PIL Image.
+            np.ndarray: The generated texture as a C-contiguous (height, width, 3) uint8 array.
 
         Raises:
             ValueError: If width or height are not positive integers.
@@ -26,25 +51,124 @@ class TextureGenerator:
             raise ValueError("Width and height must be positive integers.")
 
         try:
+            cache_path = None
+            if seed is not None:
+                cache_path = TextureGenerator._cache_path(width, height, seed)
+                cached = TextureGenerator._load_from_cache(cache_path, width, height)
+                if cached is not None:
+                    return cached
+
+            rng = np.random.default_rng(seed)
+
             # Generate base and detail noise
-            base = TextureGenerator._create_seamless_noise(width, height, scale=4.0, octaves=6, persistence=0.5)
-            detail = TextureGenerator._create_seamless_noise(width, height, scale=20.0, octaves=8, persistence=0.6)
+            base = TextureGenerator._create_seamless_noise(width, height, **TextureGenerator.BASE_NOISE)
+            detail = TextureGenerator._create_seamless_noise(width, height, **TextureGenerator.DETAIL_NOISE)
 
             # Combine base and detail noise
-            combined = (base * 0.7 + detail * 0.3)
+            combined = (base * np.float32(0.7) + detail * np.float32(0.3))
             combined = (combined - combined.min()) / (combined.max() - combined.min())
 
             # Generate random colors for the texture
-            color1 = np.random.randint(100, 200, 3)
-            color2 = np.random.randint(100, 200, 3)
+            color1 = rng.integers(100, 200, 3)
+            color2 = rng.integers(100, 200, 3)
 
             # Create the final texture
-            texture = TextureGenerator._create_colored_texture(combined, color1, color2)
+            texture = TextureGenerator._create_colored_texture(combined, color1, color2, rng)
 
-            return Image.fromarray(texture)
+            if cache_path is not None:
+                TextureGenerator._save_to_cache(texture, cache_path)
+            return texture
         except Exception as e:
             raise RuntimeError(f"Failed to generate texture: {str(e)}")
 
+    @staticmethod
+    def _noise_backend() -> str:
+        """
+        Name the noise implementation in use; each produces a different field.
+
+        Returns:
+            str: The backend name.
+        """
+        if pyfastnoisesimd is not None:
+            return 'pyfastnoisesimd'
+        if simplex_jit is not None:
+            return 'numba'
+        return 'noise'
+
+    @staticmethod
+    def _cache_path(width: int, height: int, seed: int) -> str:
+        """
+        Build the cache file path for a texture's generation parameters.
+
+        Args:
+            width (int): The width of the texture in pixels.
+            height (int): The height of the texture in pixels.
+            seed (int): Seed for the random colors and variation.
+
+        Returns:
+            str: Path of the cached PNG.
+        """
+        params = (f"v{TextureGenerator.CACHE_VERSION}|{width}x{height}|{seed}|{TextureGenerator.BASE_NOISE}|"
+                  f"{TextureGenerator.DETAIL_NOISE}|{TextureGenerator._noise_backend()}")
+        key = hashlib.sha1(params.encode()).hexdigest()
+        return os.path.join(TextureGenerator.CACHE_DIR, f"{key}.png")
+
+    @staticmethod
+    def _load_from_cache(path: str, width: int, height: int) -> Optional[np.ndarray]:
+        """
+        Read a cached texture, discarding the entry if it is corrupt.
+
+        Args:
+            path (str): Path of the cached PNG.
+            width (int): The expected width of the texture in pixels.
+            height (int): The expected height of the texture in pixels.
+
+        Returns:
+            np.ndarray: The cached texture, or None on a miss.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with Image.open(path) as img:
+                texture = np.asarray(img.convert('RGB'))
+            if texture.shape == (height, width, 3):
+                return texture
+        except (OSError, SyntaxError, ValueError):
+            # Pillow reports some broken PNG chunks as SyntaxError
+            pass
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    @staticmethod
+    def _save_to_cache(texture: np.ndarray, path: str):
+        """
+        Store a generated texture in the cache.
+
+        The PNG is written to a temporary file and renamed into place, so an
+        interrupted write never leaves a partial entry under the final name.
+        The temporary name is fixed per entry, so a file left behind by a killed
+        process is overwritten by the next write instead of piling up.
+
+        Args:
+            texture (np.ndarray): The texture to store.
+            path (str): Path of the cached PNG.
+        """
+        tmp_path = path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                Image.fromarray(texture).save(f, "PNG", optimize=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            # A read-only cache only costs us the warm start
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     @staticmethod
     def _create_seamless_noise(width: int, height: int, scale: float = 50.0, octaves: int = 6, 
                                persistence: float = 0.5, lacunarity: float = 2.0) -> np.ndarray:
@@ -62,20 +186,81 @@ class TextureGenerator:
         Returns:
             np.ndarray: The generated seamless noise.
         """
-        world = np.zeros((height, width))
+        if pyfastnoisesimd is None and simplex_jit is not None:
+            cos_theta, sin_theta, sin_phi, cos_phi = TextureGenerator._sphere_terms(width, height)
+            return simplex_jit.generate_noise(cos_theta, sin_theta, sin_phi, cos_phi,
+                                              scale, octaves, persistence, lacunarity)
+
+        if pyfastnoisesimd is not None:
+            x3, y3, z3 = TextureGenerator._sphere_coordinates(width, height)
+            fns = pyfastnoisesimd.Noise()
+            fns.noiseType = pyfastnoisesimd.NoiseType.SimplexFractal
+            fns.frequency = 1.0
+            fns.fractal.octaves = octaves
+            fns.fractal.gain = persistence
+            fns.fractal.lacunarity = lacunarity
+            coords = pyfastnoisesimd.empty_coords(width * height)
+            coords[0, :] = (x3 * scale).ravel()
+            coords[1, :] = (y3 * scale).ravel()
+            coords[2, :] = (z3 * scale).ravel()
+            return fns.genFromCoords(coords)[:width * height].reshape(height, width)
+
+        cos_theta, sin_theta, sin_phi, cos_phi = TextureGenerator._sphere_terms(width, height)
+        cos_theta = cos_theta.tolist()
+        sin_theta = sin_theta.tolist()
+        rings = (sin_phi * scale).tolist()
+        heights = (cos_phi * scale).tolist()
+
+        world = np.zeros((height, width), dtype=np.float32)
         for y in range(height):
+            ring, z = rings[y], heights[y]
+            row = world[y]
             for x in range(width):
-                theta = x / width * 2 * np.pi
-                phi = y / height * np.pi
-                x3 = np.cos(theta) * np.sin(phi)
-                y3 = np.sin(theta) * np.sin(phi)
-                z3 = np.cos(phi)
-                world[y][x] = snoise3(x3 * scale, y3 * scale, z3 * scale, 
-                                      octaves=octaves, persistence=persistence, lacunarity=lacunarity)
+                row[x] = snoise3(cos_theta[x] * ring, sin_theta[x] * ring, z,
+                                 octaves=octaves, persistence=persistence, lacunarity=lacunarity)
         return world
 
     @staticmethod
-    def _create_colored_texture(noise: np.ndarray, color1: np.ndarray, color2: np.ndarray) -> np.ndarray:
+    def _sphere_terms(width: int, height: int):
+        """
+        Trig terms of the equirectangular mapping onto the unit sphere.
+
+        Longitude terms are shared by every row and latitude terms by every pixel
+        in a row, so a pixel's position is cos/sin(theta) times sin(phi), with
+        cos(phi) as its height.
+
+        Args:
+            width (int): The width of the texture in pixels.
+            height (int): The height of the texture in pixels.
+
+        Returns:
+            tuple: cos(theta) and sin(theta) per column, sin(phi) and cos(phi) per row.
+        """
+        theta = np.arange(width) * (2 * np.pi / width)
+        phi = np.arange(height) * (np.pi / height)
+        return np.cos(theta), np.sin(theta), np.sin(phi), np.cos(phi)
+
+    @staticmethod
+    def _sphere_coordinates(width: int, height: int):
+        """
+        Map every pixel of an equirectangular texture onto the unit sphere.
+
+        Args:
+            width (int): The width of the texture in pixels.
+            height (int): The height of the texture in pixels.
+
+        Returns:
+            tuple: The x, y and z coordinates as (height, width) float32 arrays.
+        """
+        cos_theta, sin_theta, sin_phi, cos_phi = TextureGenerator._sphere_terms(width, height)
+        x3 = np.outer(sin_phi, cos_theta).astype(np.float32)
+        y3 = np.outer(sin_phi, sin_theta).astype(np.float32)
+        z3 = np.broadcast_to(cos_phi[:, None], x3.shape).astype(np.float32)
+        return x3, y3, z3
+
+    @staticmethod
+    def _create_colored_texture(noise: np.ndarray, color1: np.ndarray, color2: np.ndarray,
+                                rng: np.random.Generator) -> np.ndarray:
         """
         Create a colored texture from noise data and two colors.
 
@@ -83,15 +268,16 @@ class TextureGenerator:
             noise (np.ndarray): The noise data.
             color1 (np.ndarray): The first color as an RGB array.
             color2 (np.ndarray): The second color as an RGB array.
+            rng (np.random.Generator): Random generator for the color variation.
 
         Returns:
             np.ndarray: The colored texture as a 3D numpy array.
         """
-        texture = np.zeros((*noise.shape, 3), dtype=np.uint8)
-        for y in range(noise.shape[0]):
-            for x in range(noise.shape[1]):
-                value = noise[y][x]
-                color = color1 * (1 - value) + color2 * value
-                variation = np.random.uniform(0.99, 1.01, 3)
-                texture[y][x] = np.clip(color * variation, 0, 255).astype(np.uint8)
-        return texture
\ No newline at end of file
+        value = noise[..., None].astype(np.float32)
+        color = color1.astype(np.float32) * (1 - value) + color2.astype(np.float32) * value
+        # One bulk float32 draw for the whole image, scaled in place to [0.99, 1.01)
+        variation = rng.random(color.shape, dtype=np.float32)
+        variation *= np.float32(0.02)
+        variation += np.float32(0.99)
+        color *= variation
+        return np.clip(color, 0, 255, out=color).astype(np.uint8)